@@ -29,7 +29,7 @@ class EnvFormat(str, Enum):
             raise UnsupportedFeature(
                 f"Cannot determine envfile format, {reason}",
                 solution=(
-                    f"Please use one of the supported suffixes: {cls._suffixes_repr()}\n"
+                    f"Please use one of the supported suffixes: {_SUPPORTED_SUFFIXES}\n"
                     f"You can also define the format explicitly instead of letting {APP_NAME} choose."
                 ),
             ) from e
@@ -42,6 +42,18 @@ class EnvFormat(str, Enum):
         )
 
 
+# The members never change, so the listing shown in error messages can be built just once.
+_SUPPORTED_SUFFIXES = EnvFormat._suffixes_repr()
+
+
+def _quote_name(name: str) -> str:
+    # Variable names are nearly always plain identifiers which never need quoting,
+    # checking for that is cheaper than the regex search done by shlex.quote.
+    if name.isidentifier() and name.isascii():
+        return name
+    return shlex.quote(name)
+
+
 def generate_envfile(build_config: BuildConfig, fmt: EnvFormat, relative_to_path: Path) -> str:
     """Generate an environment file in the specified format.
 
@@ -57,14 +69,14 @@ def generate_envfile(build_config: BuildConfig, fmt: EnvFormat, relative_to_path
     # pass all variables as placeholder mappings to env var template value resolution
     mappings = {var.name: var.value for var in build_config.environment_variables}
     mappings["output_dir"] = relative_to_path.as_posix()
-    env_vars = [
-        (env_var.name, env_var.resolve_value(mappings))
-        for env_var in build_config.environment_variables
-    ]
+    env_vars = build_config.environment_variables
     if fmt == EnvFormat.json:
-        content = json.dumps([{"name": name, "value": value} for name, value in env_vars])
+        content = json.dumps(
+            [{"name": var.name, "value": var.resolve_value(mappings)} for var in env_vars]
+        )
     else:
         content = "\n".join(
-            f"export {shlex.quote(name)}={shlex.quote(value)}" for name, value in env_vars
+            f"export {_quote_name(var.name)}={shlex.quote(var.resolve_value(mappings))}"
+            for var in env_vars
         )
     return content
@@ -58,16 +58,17 @@ class EnvironmentVariable(pydantic.BaseModel):
         # "Recursively" resolve potentially nested variables up to len(mappings) tries
         log.debug(f"Resolving environment variable '{self.name}={self.value}'")
         ret = self.value
+        t_old = string.Template(ret)
+        p_old = get_placeholders(t_old)
         substituted: set[str] = set()
         for i, m in enumerate(mappings):
             log.debug(f"EnvironmentVariable resolution iteration {i + 1}.: {ret}")
 
-            t_old = string.Template(ret)
             ret = t_old.safe_substitute(mappings)
             t_new = string.Template(ret)
             p_new = get_placeholders(t_new)
 
-            substituted |= get_placeholders(t_old) & mappings.keys()
+            substituted |= p_old & mappings.keys()
             if substituted & p_new:
                 raise BaseError(
                     f"Detected a cycle in environment variable expansion of '{self.name}'",
@@ -77,6 +78,10 @@ class EnvironmentVariable(pydantic.BaseModel):
                         "variables altogether."
                     ),
                 )
+            # Each pass also unescapes "$$", so only a fixpoint guarantees further passes are NOOPs
+            if ret == t_old.template:
+                break
+            t_old, p_old = t_new, p_new
 
         return ret
 
@@ -2,6 +2,7 @@
 from collections.abc import Iterable
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 import pydantic
@@ -36,7 +37,12 @@ class Property(pydantic.BaseModel):
     value: str
 
 
-@dataclass(frozen=True)
+# Whether the APP_NAME-prefixed properties sort before the "cdx:" ones depends on which
+# name the application was invoked by.
+_APP_PROPERTIES_FIRST = PropertyEnum.PROP_FOUND_BY < PropertyEnum.PROP_CDX_NPM_PACKAGE_BUNDLED
+
+
+@dataclass(frozen=True, slots=True)
 class PropertySet:
     """Represents the semantic meaning of the set of Properties of a single Component."""
 
@@ -53,6 +59,13 @@ class PropertySet:
     @classmethod
     def from_properties(cls, props: Iterable[Property]) -> "Self":
         """Convert a list of SBOM component properties to a PropertySet."""
+        # Many components carry identical properties and PropertySets are immutable, so the
+        # result can be shared between them.
+        return cls._from_name_value_pairs(tuple((prop.name, prop.value) for prop in props))
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _from_name_value_pairs(cls, pairs: tuple[tuple[PropertyEnum, str], ...]) -> "Self":
         bundler_package_binary = False
         found_by = None
         missing_hash_in_file = []
@@ -63,27 +76,27 @@ class PropertySet:
         rpm_modularity_label = ""
         rpm_summary = ""
 
-        for prop in props:
-            if prop.name == PropertyEnum.PROP_BUNDLER_PACKAGE_BINARY:
+        for name, value in pairs:
+            if name is PropertyEnum.PROP_BUNDLER_PACKAGE_BINARY:
                 bundler_package_binary = True
-            elif prop.name == PropertyEnum.PROP_CDX_NPM_PACKAGE_BUNDLED:
+            elif name is PropertyEnum.PROP_CDX_NPM_PACKAGE_BUNDLED:
                 npm_bundled = True
-            elif prop.name == PropertyEnum.PROP_CDX_NPM_PACKAGE_DEVELOPMENT:
+            elif name is PropertyEnum.PROP_CDX_NPM_PACKAGE_DEVELOPMENT:
                 npm_development = True
-            elif prop.name == PropertyEnum.PROP_FOUND_BY:
-                found_by = prop.value
-            elif prop.name == PropertyEnum.PROP_MISSING_HASH_IN_FILE:
-                missing_hash_in_file.append(prop.value)
-            elif prop.name == PropertyEnum.PROP_PIP_PACKAGE_BINARY:
+            elif name is PropertyEnum.PROP_FOUND_BY:
+                found_by = value
+            elif name is PropertyEnum.PROP_MISSING_HASH_IN_FILE:
+                missing_hash_in_file.append(value)
+            elif name is PropertyEnum.PROP_PIP_PACKAGE_BINARY:
                 pip_package_binary = True
-            elif prop.name == PropertyEnum.PROP_PIP_PACKAGE_BUILD_DEPENDENCY:
+            elif name is PropertyEnum.PROP_PIP_PACKAGE_BUILD_DEPENDENCY:
                 pip_build_dependency = True
-            elif prop.name == PropertyEnum.PROP_RPM_MODULARITY_LABEL:
-                rpm_modularity_label = prop.value
-            elif prop.name == PropertyEnum.PROP_RPM_SUMMARY:
-                rpm_summary = prop.value
+            elif name is PropertyEnum.PROP_RPM_MODULARITY_LABEL:
+                rpm_modularity_label = value
+            elif name is PropertyEnum.PROP_RPM_SUMMARY:
+                rpm_summary = value
             else:
-                assert_never(prop.name)
+                assert_never(name)
 
         return cls(
             bundler_package_binary,
@@ -98,48 +111,92 @@ class PropertySet:
         )
 
     def to_properties(self) -> list[Property]:
-        """Convert a PropertySet to a list of SBOM component properties."""
-        props = []
+        """Convert a PropertySet to a list of SBOM component properties, sorted by name and value."""
+        # Within each prefix the properties are emitted in name order, so only the file paths
+        # need sorting.
+        app_props = []
         if self.bundler_package_binary:
-            props.append(Property(name=PropertyEnum.PROP_BUNDLER_PACKAGE_BINARY, value="true"))
+            app_props.append(Property(name=PropertyEnum.PROP_BUNDLER_PACKAGE_BINARY, value="true"))
         if self.found_by:
-            props.append(Property(name=PropertyEnum.PROP_FOUND_BY, value=self.found_by))
-        props.extend(
+            app_props.append(Property(name=PropertyEnum.PROP_FOUND_BY, value=self.found_by))
+        app_props.extend(
             Property(name=PropertyEnum.PROP_MISSING_HASH_IN_FILE, value=filepath)
-            for filepath in self.missing_hash_in_file
+            for filepath in sorted(self.missing_hash_in_file)
         )
-        if self.npm_bundled:
-            props.append(Property(name=PropertyEnum.PROP_CDX_NPM_PACKAGE_BUNDLED, value="true"))
-        if self.npm_development:
-            props.append(Property(name=PropertyEnum.PROP_CDX_NPM_PACKAGE_DEVELOPMENT, value="true"))
+        if self.pip_package_binary:
+            app_props.append(Property(name=PropertyEnum.PROP_PIP_PACKAGE_BINARY, value="true"))
         if self.pip_build_dependency:
-            props.append(
+            app_props.append(
                 Property(name=PropertyEnum.PROP_PIP_PACKAGE_BUILD_DEPENDENCY, value="true")
             )
-        if self.pip_package_binary:
-            props.append(Property(name=PropertyEnum.PROP_PIP_PACKAGE_BINARY, value="true"))
         if self.rpm_modularity_label:
-            props.append(
+            app_props.append(
                 Property(
                     name=PropertyEnum.PROP_RPM_MODULARITY_LABEL, value=self.rpm_modularity_label
                 )
             )
         if self.rpm_summary:
-            props.append(Property(name=PropertyEnum.PROP_RPM_SUMMARY, value=self.rpm_summary))
+            app_props.append(Property(name=PropertyEnum.PROP_RPM_SUMMARY, value=self.rpm_summary))
+
+        cdx_props = []
+        if self.npm_bundled:
+            cdx_props.append(Property(name=PropertyEnum.PROP_CDX_NPM_PACKAGE_BUNDLED, value="true"))
+        if self.npm_development:
+            cdx_props.append(
+                Property(name=PropertyEnum.PROP_CDX_NPM_PACKAGE_DEVELOPMENT, value="true")
+            )
 
-        return sorted(props, key=lambda p: (p.name, p.value))
+        if _APP_PROPERTIES_FIRST:
+            return app_props + cdx_props
+        return cdx_props + app_props
 
     def merge(self, other: "Self") -> "Self":
         """Combine two PropertySets."""
-        cls = type(self)
+        if self is other:
+            # Merging is idempotent, and from_properties shares instances between components.
+            return self
+        return type(self).merge_all((self, other))
+
+    @classmethod
+    def merge_all(cls, property_sets: Iterable["Self"]) -> "Self":
+        """Combine one or more PropertySets.
+
+        Folds all the sets in a single pass instead of building an intermediate PropertySet
+        (and a new frozenset of missing hashes) for every pairwise merge.
+        """
+        first, *rest = property_sets
+        if not rest:
+            return first
+
+        bundler_package_binary = first.bundler_package_binary
+        found_by = first.found_by
+        missing_hash_in_file = set(first.missing_hash_in_file)
+        npm_bundled = first.npm_bundled
+        npm_development = first.npm_development
+        pip_build_dependency = first.pip_build_dependency
+        pip_package_binary = first.pip_package_binary
+        rpm_modularity_label = first.rpm_modularity_label
+        rpm_summary = first.rpm_summary
+
+        for other in rest:
+            bundler_package_binary = bundler_package_binary or other.bundler_package_binary
+            found_by = found_by or other.found_by
+            missing_hash_in_file.update(other.missing_hash_in_file)
+            npm_bundled = npm_bundled and other.npm_bundled
+            npm_development = npm_development and other.npm_development
+            pip_build_dependency = pip_build_dependency and other.pip_build_dependency
+            pip_package_binary = pip_package_binary or other.pip_package_binary
+            rpm_modularity_label = rpm_modularity_label or other.rpm_modularity_label
+            rpm_summary = rpm_summary or other.rpm_summary
+
         return cls(
-            bundler_package_binary=self.bundler_package_binary or other.bundler_package_binary,
-            found_by=self.found_by or other.found_by,
-            missing_hash_in_file=self.missing_hash_in_file | other.missing_hash_in_file,
-            npm_bundled=self.npm_bundled and other.npm_bundled,
-            npm_development=self.npm_development and other.npm_development,
-            pip_build_dependency=self.pip_build_dependency and other.pip_build_dependency,
-            pip_package_binary=self.pip_package_binary or other.pip_package_binary,
-            rpm_modularity_label=self.rpm_modularity_label or other.rpm_modularity_label,
-            rpm_summary=self.rpm_summary or other.rpm_summary,
+            bundler_package_binary,
+            found_by,
+            frozenset(missing_hash_in_file),
+            npm_bundled,
+            npm_development,
+            pip_build_dependency,
+            pip_package_binary,
+            rpm_modularity_label,
+            rpm_summary,
         )
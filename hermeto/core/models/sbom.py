@@ -3,12 +3,11 @@ import hashlib
 import json
 import logging
 import re
-from collections import defaultdict
 from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from functools import cached_property, partial, reduce
-from itertools import chain, groupby
+from functools import cached_property, partial
+from itertools import chain
 from pathlib import Path
 from typing import Annotated, Any, Callable, Literal, Union
 from urllib.parse import urlparse
@@ -734,9 +733,12 @@ class SPDXSbom(pydantic.BaseModel):
     @cached_property
     def root_id(self) -> str:
         """Return the root_id of this SBOM."""
-        direct_relationships, inverse_relationships = defaultdict(list), dict()
+        # Only which packages relate to something (and in what order) matters here, not what
+        # they relate to, so there are no lists of related elements to build.
+        direct_relationships: dict[str, None] = {}
+        inverse_relationships: dict[str, str] = {}
         for rel in self.relationships:
-            direct_relationships[rel.spdxElementId].append(rel.relatedSpdxElement)
+            direct_relationships[rel.spdxElementId] = None
             inverse_relationships[rel.relatedSpdxElement] = rel.spdxElementId
         unidirectionally_related_package = lambda p: inverse_relationships.get(p) == self.SPDXID
         # Note: defaulting to top-level SPDXID is inherited from the original implementation.
@@ -759,6 +761,10 @@ class SPDXSbom(pydantic.BaseModel):
         """Retarget and prune relationships."""
         out, from_root, to_root = [], from_sbom.root_id, to_sbom.root_id
         for r in from_sbom.relationships:
+            # The retargeting below never touches relatedSpdxElement, so relations which would be
+            # pruned can be skipped before any work is done on them.
+            if r.relatedSpdxElement == from_root and r.relationshipType == "DESCRIBES":
+                continue
             # New relation must be with to_sbom root if old relation was of from_sbom root.
             # New relation must also be moved to new root if it was with from_sbom root.
             # These two moves cannot happen simultaneously.
@@ -767,13 +773,12 @@ class SPDXSbom(pydantic.BaseModel):
                 n_spdxEI = to_root
             else:
                 n_spdxEI = eid
-            # Do a copy to ensure we are not pulling a carpet from underneath us:
-            new_rel = r.model_copy(update={"spdxElementId": n_spdxEI}, deep=True)
-            if not (
-                new_rel.relatedSpdxElement == from_sbom.root_id
-                and new_rel.relationshipType == "DESCRIBES"
-            ):
-                out.append(new_rel)
+            if n_spdxEI == eid:
+                # Nothing changes, the relation can be shared just like the ones of to_sbom are.
+                out.append(r)
+            else:
+                # Do a copy to ensure we are not pulling a carpet from underneath us:
+                out.append(r.model_copy(update={"spdxElementId": n_spdxEI}))
         return out
 
     def __add__(self, other: Union["SPDXSbom", Sbom]) -> "SPDXSbom":
@@ -951,17 +956,18 @@ def merge_component_annotations(annotations: Iterable[Annotation]) -> list[Annot
 
 def merge_component_properties(components: Iterable[Component]) -> list[Component]:
     """Sort and de-duplicate components while merging their `properties`."""
-    components = sorted(components, key=Component.key)
-    grouped_components = groupby(components, key=Component.key)
+    # Grouping by hash calls key() once per component and leaves only the distinct keys to sort.
+    grouped_components: dict[str, list[Component]] = {}
+    for component in components:
+        grouped_components.setdefault(component.key(), []).append(component)
 
-    def merge_component_group(component_group: Iterable[Component]) -> Component:
-        component_group = list(component_group)
+    def merge_component_group(component_group: list[Component]) -> Component:
         prop_sets = (PropertySet.from_properties(c.properties) for c in component_group)
-        merged_prop_set = reduce(PropertySet.merge, prop_sets)
+        merged_prop_set = PropertySet.merge_all(prop_sets)
         component = component_group[0]
         return component.model_copy(update={"properties": merged_prop_set.to_properties()})
 
-    return [merge_component_group(g) for _, g in grouped_components]
+    return [merge_component_group(grouped_components[key]) for key in sorted(grouped_components)]
 
 
 # References
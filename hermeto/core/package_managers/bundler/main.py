@@ -2,6 +2,7 @@
 import asyncio
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from textwrap import dedent
 
@@ -31,6 +32,33 @@ log = logging.getLogger(__name__)
 
 CONFIG_OVERRIDE = "bundler/config_override"
 
+HERMETIC_CONFIG = dedent(
+    """
+    BUNDLE_CACHE_PATH: "${output_dir}/deps/bundler"
+    BUNDLE_DEPLOYMENT: "true"
+    BUNDLE_NO_PRUNE: "true"
+    BUNDLE_ALLOW_OFFLINE_INSTALL: "true"
+    BUNDLE_DISABLE_VERSION_CHECK: "true"
+    BUNDLE_VERSION: "system"
+"""
+)
+# Note: if a package depends on a git revision then the following variables
+# are necessary for a hermetic build:
+#  BUNDLE_DISABLE_LOCAL_BRANCH_CHECK
+#  BUNDLE_DISABLE_LOCAL_REVISION_CHECK
+# because otherwise some (potentially all, depending on exact set of
+# ecosystem components versions, environment variables and celestial
+# alignment) Bundler versions will try to fetch the latest changes of the
+# remotes which may be present even when instructed not to with --local
+# flag.
+# See https://bundler.io/guides/git.html#local-git-repos for details.
+# (or https://github.com/rubygems/bundler-site/blob/
+#             9ff3b76e9866524ecefe165633ffb547f0004a99/source/guides/git.html.md
+# if the link above ceases to exist).
+HERMETIC_GIT_CONFIG = (
+    'BUNDLE_DISABLE_LOCAL_BRANCH_CHECK: "true"\nBUNDLE_DISABLE_LOCAL_REVISION_CHECK: "true"\n'
+)
+
 
 def fetch_bundler_source(request: Request) -> RequestOutput:
     """Resolve and process all bundler packages."""
@@ -40,13 +68,18 @@ def fetch_bundler_source(request: Request) -> RequestOutput:
     )
     project_files: list[ProjectFile] = []
     git_paths = []
+    # All packages live in the same repository, there is no need to query git for each of them.
+    vcs_qualifiers = _get_vcs_qualifiers(request.source_dir)
+    deps_dir = request.output_dir.join_within_root("deps", "bundler")
+    deps_dir.path.mkdir(parents=True, exist_ok=True)
 
     for package in request.bundler_packages:
         path_within_root = request.source_dir.join_within_root(package.path)
         _comps, _git_paths = _resolve_bundler_package(
             package_dir=path_within_root,
-            output_dir=request.output_dir,
+            deps_dir=deps_dir,
             binary_filters=package.binary,
+            vcs_qualifiers=vcs_qualifiers,
         )
         components.extend(_comps)
         git_paths.extend(_git_paths)
@@ -73,48 +106,48 @@ FSDepName = str
 
 def _resolve_bundler_package(
     package_dir: RootedPath,
-    output_dir: RootedPath,
+    deps_dir: RootedPath,
+    vcs_qualifiers: dict[str, str] | None,
     binary_filters: BundlerBinaryFilters | None = None,
 ) -> tuple[list[Component], list[tuple[DepName, FSDepName]]]:
     """Process a request for a single bundler package."""
-    deps_dir = output_dir.join_within_root("deps", "bundler")
-    deps_dir.path.mkdir(parents=True, exist_ok=True)
     dependencies = parse_lockfile(package_dir, binary_filters)
 
     name, version = _get_main_package_name_and_version(package_dir, dependencies)
-    try:
-        qualifiers = get_vcs_qualifiers(package_dir.root)
-    except NotAGitRepo:
-        if get_config().mode == Mode.PERMISSIVE:
-            qualifiers = None
-        else:
-            raise
     main_package_purl = PackageURL(
         type="gem",
         name=name,
         version=version,
-        qualifiers=qualifiers,
+        qualifiers=vcs_qualifiers,
         subpath=str(package_dir.subpath_from_root),
     )
 
     components = [Component(name=name, version=version, purl=main_package_purl.to_string())]
     git_paths = []
     files_to_download: dict[str, RootedPath] = {}
+    # Several gems can come from the same git repository at the same revision,
+    # each such repository must only be cloned once:
+    git_repos_to_clone: dict[FSDepName, GitDependency] = {}
+    # Component validation copies the list, the properties themselves can be shared.
+    binary_properties = PropertySet(bundler_package_binary=True).to_properties()
     for dep in dependencies:
         properties: list[Property] = []
         match dep:
             case GemPlatformSpecificDependency():
                 files_to_download[dep.remote_location] = dep.download_location(deps_dir)
-                properties = PropertySet(bundler_package_binary=True).to_properties()
+                properties = binary_properties
             case GemDependency():
                 files_to_download[dep.remote_location] = dep.download_location(deps_dir)
             case GitDependency():
-                dep.download_to(deps_dir)
-                git_paths.append((dep.name, dep.repo_name + "-" + dep.ref[:12]))
+                fs_dep_name = dep.repo_name + "-" + dep.ref[:12]
+                git_repos_to_clone.setdefault(fs_dep_name, dep)
+                git_paths.append((dep.name, fs_dep_name))
 
         c = Component(name=dep.name, version=dep.version, purl=dep.purl, properties=properties)
         components.append(c)
 
+    if git_repos_to_clone:
+        _clone_git_dependencies(list(git_repos_to_clone.values()), deps_dir)
     if files_to_download:
         asyncio.run(
             async_download_files(
@@ -125,6 +158,30 @@ def _resolve_bundler_package(
     return components, git_paths
 
 
+def _get_vcs_qualifiers(source_dir: RootedPath) -> dict[str, str] | None:
+    """Get the vcs_url qualifiers of the source repository, tolerating its absence if permissive."""
+    try:
+        return get_vcs_qualifiers(source_dir.root)
+    except NotAGitRepo:
+        if get_config().mode == Mode.PERMISSIVE:
+            return None
+        raise
+
+
+def _clone_git_dependencies(dependencies: list[GitDependency], deps_dir: RootedPath) -> None:
+    """Clone git dependencies concurrently.
+
+    Cloning is dominated by waiting on the network, so threads are sufficient
+    to overlap the clones. Each dependency must be cloned to a distinct directory.
+    """
+    max_workers = min(get_config().runtime.concurrency_limit, len(dependencies))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(dep.download_to, deps_dir) for dep in dependencies]
+        # Re-raise the first failure, if any, once all clones are done.
+        for future in futures:
+            future.result()
+
+
 def _get_main_package_name_and_version(
     package_dir: RootedPath,
     dependencies: ParseResult,
@@ -171,11 +228,14 @@ def _get_name_and_version_from_lockfile(dependencies: ParseResult) -> tuple[str,
     See design doc for more details:
     https://github.com/hermetoproject/hermeto/blob/main/docs/design/bundler.md
     """
-    for dep in dependencies:
-        if isinstance(dep, PathDependency) and dep.subpath == ".":
-            return dep.name, dep.version
-
-    return None
+    return next(
+        (
+            (dep.name, dep.version)
+            for dep in dependencies
+            if isinstance(dep, PathDependency) and dep.subpath == "."
+        ),
+        None,
+    )
 
 
 def _get_repo_name_from_origin_remote(package_dir: RootedPath) -> str:
@@ -208,40 +268,17 @@ def _prepare_for_hermetic_build(
 ) -> ProjectFile:
     """Prepare a package for hermetic build by injecting necessary config."""
     potential_bundle_config = source_dir.join_within_root(".bundle/config").path
-    hermetic_config = dedent(
-        """
-        BUNDLE_CACHE_PATH: "${output_dir}/deps/bundler"
-        BUNDLE_DEPLOYMENT: "true"
-        BUNDLE_NO_PRUNE: "true"
-        BUNDLE_ALLOW_OFFLINE_INSTALL: "true"
-        BUNDLE_DISABLE_VERSION_CHECK: "true"
-        BUNDLE_VERSION: "system"
-    """
-    )
-    # Note: if a package depends on a git revision then the following variables
-    # are necessary for a hermetic build:
-    #  BUNDLE_DISABLE_LOCAL_BRANCH_CHECK
-    #  BUNDLE_DISABLE_LOCAL_REVISION_CHECK
-    # because otherwise some (potentially all, depending on exact set of
-    # ecosystem components versions, environment variables and celestial
-    # alignment) Bundler versions will try to fetch the latest changes of the
-    # remotes which may be present even when instructed not to with --local
-    # flag.
-    # See https://bundler.io/guides/git.html#local-git-repos for details.
-    # (or https://github.com/rubygems/bundler-site/blob/
-    #             9ff3b76e9866524ecefe165633ffb547f0004a99/source/guides/git.html.md
-    # if the link above ceases to exist).
+    config_entries = [HERMETIC_CONFIG]
     if git_paths is not None:
-        hermetic_config += 'BUNDLE_DISABLE_LOCAL_BRANCH_CHECK: "true"\n'
-        hermetic_config += 'BUNDLE_DISABLE_LOCAL_REVISION_CHECK: "true"\n'
+        config_entries.append(HERMETIC_GIT_CONFIG)
         for packname, dirname in git_paths:
             # "-" in variable names is deprecated in Bundler and now generates
             # a warning and a suggestion to replace all dashes with triple
             # underscores. Package names sometimes contain dashes:
             varname = "BUNDLE_LOCAL." + packname.upper().replace("-", "___")
             location = "${output_dir}/deps/bundler/" + dirname
-            config_entry = varname + f': "{location}"'
-            hermetic_config += f"{config_entry}\n"
+            config_entries.append(f'{varname}: "{location}"\n')
+    hermetic_config = "".join(config_entries)
     if potential_bundle_config.is_file():
         config_data = potential_bundle_config.read_text()
         config_data += hermetic_config
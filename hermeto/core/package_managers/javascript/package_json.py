@@ -18,15 +18,13 @@ class PackageJson(UserDict):
     @classmethod
     def from_file(cls, path: Path) -> "PackageJson":
         """Create a PackageJson object from a package.json file."""
-        if not path.exists():
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
             raise LockfileNotFound(
                 path,
                 solution="Make sure the package.json file exists in the specified directory.",
-            )
-
-        try:
-            with path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
+            ) from None
         except json.decoder.JSONDecodeError as e:
             raise InvalidLockfileFormat(
                 lockfile_path=path,
@@ -99,3 +99,23 @@ def test_generate_env_dependent_var() -> None:
         ]
     )
     assert content == expected
+
+
+def test_generate_env_quotes_unusual_names() -> None:
+    env_vars = [
+        {"name": "_GO_CACHE2", "value": "off"},
+        {"name": "NOT A NAME", "value": "off"},
+        {"name": "NÁZEV", "value": "off"},
+    ]
+    build_config = BuildConfig(environment_variables=env_vars, project_files=[])
+
+    expect_content = dedent(
+        """
+        export 'NOT A NAME'=off
+        export 'NÁZEV'=off
+        export _GO_CACHE2=off
+        """
+    ).strip()
+
+    content = generate_envfile(build_config, EnvFormat.env, relative_to_path=Path("/output/dir"))
+    assert content == expect_content
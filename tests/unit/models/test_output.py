@@ -162,6 +162,23 @@ class TestEnvironmentVariable:
     ) -> None:
         assert env_variables[var].resolve_value(mappings) == expected
 
+    def test_resolution_keeps_unknown_placeholders(self) -> None:
+        env = EnvironmentVariable(name="PATH", value="${output_dir}/bin:${PATH}")
+        mappings = {"output_dir": "/tmp/output", "foo": "bar"}
+        assert env.resolve_value(mappings) == "/tmp/output/bin:${PATH}"
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            pytest.param("cost $$$$5", "cost $5", id="escaped_dollar_in_text"),
+            pytest.param("price $$$$", "price $", id="escaped_dollar_at_end"),
+        ],
+    )
+    def test_resolution_unescapes_dollars_on_every_pass(self, value: str, expected: str) -> None:
+        env = EnvironmentVariable(name="PRICE", value=value)
+        mappings = {"output_dir": "/tmp/output", "A": "a", "B": "b"}
+        assert env.resolve_value(mappings) == expected
+
     @pytest.mark.parametrize(
         "envs",
         [
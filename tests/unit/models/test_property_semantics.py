@@ -1,4 +1,6 @@
 # SPDX-License-Identifier: GPL-3.0-only
+from functools import reduce
+
 import pytest
 
 from hermeto import APP_NAME
@@ -164,6 +166,11 @@ def test_merge_component_properties(
 
 
 class TestPropertySet:
+    @pytest.mark.parametrize("name", list(PropertyEnum))
+    def test_from_properties_handles_every_property_name(self, name: PropertyEnum) -> None:
+        property_set = PropertySet.from_properties([Property(name=name, value="true")])
+        assert property_set != PropertySet()
+
     @pytest.mark.parametrize(
         "properties, property_set",
         [
@@ -206,6 +213,35 @@ class TestPropertySet:
                     npm_development=True,
                 ),
             ),
+            (
+                [
+                    Property(name=PropertyEnum.PROP_RPM_SUMMARY, value="summary"),
+                    Property(name=PropertyEnum.PROP_CDX_NPM_PACKAGE_DEVELOPMENT, value="true"),
+                    Property(name=PropertyEnum.PROP_PIP_PACKAGE_BUILD_DEPENDENCY, value="true"),
+                    Property(name=PropertyEnum.PROP_RPM_MODULARITY_LABEL, value="label"),
+                    Property(
+                        name=PropertyEnum.PROP_MISSING_HASH_IN_FILE, value="b/requirements.txt"
+                    ),
+                    Property(name=PropertyEnum.PROP_PIP_PACKAGE_BINARY, value="true"),
+                    Property(name=PropertyEnum.PROP_BUNDLER_PACKAGE_BINARY, value="true"),
+                    Property(
+                        name=PropertyEnum.PROP_MISSING_HASH_IN_FILE, value="a/requirements.txt"
+                    ),
+                    Property(name=PropertyEnum.PROP_FOUND_BY, value=f"{APP_NAME}"),
+                    Property(name=PropertyEnum.PROP_CDX_NPM_PACKAGE_BUNDLED, value="true"),
+                ],
+                PropertySet(
+                    bundler_package_binary=True,
+                    found_by=f"{APP_NAME}",
+                    missing_hash_in_file=frozenset(["a/requirements.txt", "b/requirements.txt"]),
+                    npm_bundled=True,
+                    npm_development=True,
+                    pip_build_dependency=True,
+                    pip_package_binary=True,
+                    rpm_modularity_label="label",
+                    rpm_summary="summary",
+                ),
+            ),
         ],
     )
     def test_conversion_from_and_to_properties(
@@ -214,6 +250,16 @@ class TestPropertySet:
         assert PropertySet.from_properties(properties) == property_set
         assert property_set.to_properties() == sorted(properties, key=lambda p: (p.name, p.value))
 
+    def test_from_properties_shares_results_for_identical_properties(self) -> None:
+        def make_properties() -> list[Property]:
+            return [
+                Property(name=PropertyEnum.PROP_FOUND_BY, value=f"{APP_NAME}"),
+                Property(name=PropertyEnum.PROP_MISSING_HASH_IN_FILE, value="go.sum"),
+            ]
+
+        property_set = PropertySet.from_properties(make_properties())
+        assert PropertySet.from_properties(make_properties()) is property_set
+
     @pytest.mark.parametrize(
         "set_a, set_b, expect_merged",
         [
@@ -262,6 +308,12 @@ class TestPropertySet:
                 PropertySet(pip_package_binary=True),
                 PropertySet(pip_package_binary=True),
             ),
+            (
+                # an empty set is not neutral: it clears the flags that all components must share
+                PropertySet(npm_bundled=True, npm_development=True, pip_build_dependency=True),
+                PropertySet(),
+                PropertySet(),
+            ),
         ],
     )
     def test_merge(
@@ -269,6 +321,33 @@ class TestPropertySet:
     ) -> None:
         assert set_a.merge(set_b) == expect_merged
 
+    @pytest.mark.parametrize(
+        "property_sets",
+        [
+            pytest.param([PropertySet(npm_bundled=True)], id="single_set"),
+            pytest.param(
+                [
+                    PropertySet(
+                        found_by=f"{APP_NAME}",
+                        missing_hash_in_file=frozenset(["go.sum"]),
+                        npm_bundled=True,
+                        npm_development=True,
+                    ),
+                    PropertySet(missing_hash_in_file=frozenset(["foo/go.sum"]), npm_bundled=True),
+                    PropertySet(
+                        found_by="impostor",
+                        missing_hash_in_file=frozenset(["go.sum"]),
+                        npm_development=True,
+                        pip_package_binary=True,
+                    ),
+                ],
+                id="multiple_sets",
+            ),
+        ],
+    )
+    def test_merge_all(self, property_sets: list[PropertySet]) -> None:
+        assert PropertySet.merge_all(property_sets) == reduce(PropertySet.merge, property_sets)
+
 
 class TestCreateBackendAnnotation:
     def test_annotation_with_deduplicated_subjects(self) -> None:
@@ -1127,6 +1127,52 @@ class TestSPDXSbom:
         with pytest.raises(UnexpectedFormat, match="Invalid JSON in annotation"):
             sbom.to_cyclonedx()
 
+    @pytest.mark.parametrize(
+        "relationships, expected_root_id",
+        [
+            pytest.param([], "SPDXRef-DOCUMENT", id="no_relationships"),
+            pytest.param(
+                [
+                    ("SPDXRef-DOCUMENT", "DESCRIBES", "SPDXRef-root"),
+                    ("SPDXRef-root", "CONTAINS", "SPDXRef-A"),
+                    ("SPDXRef-A", "CONTAINS", "SPDXRef-B"),
+                ],
+                "SPDXRef-root",
+                id="single_root",
+            ),
+            pytest.param(
+                [
+                    ("SPDXRef-DOCUMENT", "DESCRIBES", "SPDXRef-root"),
+                    ("SPDXRef-DOCUMENT", "DESCRIBES", "SPDXRef-other"),
+                    ("SPDXRef-other", "CONTAINS", "SPDXRef-B"),
+                    ("SPDXRef-root", "CONTAINS", "SPDXRef-A"),
+                ],
+                "SPDXRef-other",
+                id="first_encountered_root_wins",
+            ),
+            pytest.param(
+                [("SPDXRef-DOCUMENT", "DESCRIBES", "SPDXRef-root")],
+                "SPDXRef-DOCUMENT",
+                id="described_package_contains_nothing",
+            ),
+        ],
+    )
+    def test_root_id(
+        self,
+        mock_spdx_now: str,
+        relationships: list[tuple[str, str, str]],
+        expected_root_id: str,
+    ) -> None:
+        sbom = SPDXSbom(
+            creationInfo={"creators": [], "created": SPDX_EPOCH_STRFTIME},
+            documentNamespace="NOASSERTION",
+            relationships=[
+                SPDXRelation(spdxElementId=eid, relationshipType=rtype, relatedSpdxElement=rid)
+                for eid, rtype, rid in relationships
+            ],
+        )
+        assert sbom.root_id == expected_root_id
+
     # SPDX SBOM objects are very verbose and it is rather hard to tell the
     # difference between them at a glance. It is unavoidable when a SBOM is
     # produced, but it is possible to short-cut during construction time. This
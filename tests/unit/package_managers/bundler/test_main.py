@@ -8,12 +8,16 @@ from git.repo import Repo
 from hermeto.core.constants import Mode
 from hermeto.core.errors import NotAGitRepo, PackageRejected
 from hermeto.core.package_managers.bundler.main import (
+    _clone_git_dependencies,
     _get_main_package_name_and_version,
     _get_repo_name_from_origin_remote,
+    _get_vcs_qualifiers,
     _prepare_for_hermetic_build,
+    _resolve_bundler_package,
 )
 from hermeto.core.package_managers.bundler.parser import (
     GemDependency,
+    GitDependency,
     ParseResult,
     PathDependency,
 )
@@ -201,3 +205,93 @@ def test_path_dependency_purl_strict_mode_raises_without_git_repo(
 
     with pytest.raises(NotAGitRepo):
         _ = dep.purl
+
+
+def _git_dependency(name: str, ref: str) -> GitDependency:
+    return GitDependency(
+        name=name, version="0.1.0", url=f"https://github.com/org/{name}.git", ref=ref * 40
+    )
+
+
+@mock.patch.object(GitDependency, "download_to")
+@mock.patch("hermeto.core.package_managers.bundler.main.get_config")
+@mock.patch("hermeto.core.package_managers.bundler.main._get_main_package_name_and_version")
+@mock.patch("hermeto.core.package_managers.bundler.main.parse_lockfile")
+def test_resolve_bundler_package_clones_shared_git_repository_once(
+    mock_parse_lockfile: mock.Mock,
+    mock_get_main_package_name_and_version: mock.Mock,
+    mock_get_config: mock.Mock,
+    mock_download_to: mock.Mock,
+    rooted_tmp_path: RootedPath,
+) -> None:
+    # Two gems living in the same repository at the same revision
+    dependencies = [
+        GitDependency(
+            name=name,
+            version="0.1.0",
+            url="https://github.com/org/monorepo.git",
+            ref="a" * 40,
+        )
+        for name in ("foo", "bar")
+    ]
+    mock_parse_lockfile.return_value = dependencies
+    mock_get_main_package_name_and_version.return_value = ("my_package", "0.1.0")
+    mock_get_config.return_value.runtime.concurrency_limit = 5
+
+    _, git_paths = _resolve_bundler_package(
+        package_dir=rooted_tmp_path,
+        deps_dir=rooted_tmp_path.join_within_root("deps", "bundler"),
+        vcs_qualifiers=None,
+    )
+
+    mock_download_to.assert_called_once_with(rooted_tmp_path.join_within_root("deps", "bundler"))
+    assert git_paths == [
+        ("foo", "monorepo-aaaaaaaaaaaa"),
+        ("bar", "monorepo-aaaaaaaaaaaa"),
+    ]
+
+
+@mock.patch.object(GitDependency, "download_to")
+def test_clone_git_dependencies_propagates_failures(
+    mock_download_to: mock.Mock, rooted_tmp_path: RootedPath
+) -> None:
+    mock_download_to.side_effect = [None, RuntimeError("clone failed")]
+    dependencies = [_git_dependency("foo", "a"), _git_dependency("bar", "b")]
+
+    with pytest.raises(RuntimeError, match="clone failed"):
+        _clone_git_dependencies(dependencies, rooted_tmp_path)
+
+
+@pytest.mark.parametrize("mode", [Mode.STRICT, Mode.PERMISSIVE])
+@mock.patch("hermeto.core.package_managers.bundler.main.get_config")
+@mock.patch("hermeto.core.package_managers.bundler.main.get_vcs_qualifiers")
+def test_get_vcs_qualifiers(
+    mock_get_vcs_qualifiers: mock.Mock,
+    mock_get_config: mock.Mock,
+    mode: Mode,
+    rooted_tmp_path: RootedPath,
+) -> None:
+    mock_get_vcs_qualifiers.return_value = {"vcs_url": "git+https://github.com/org/repo@abc"}
+    mock_get_config.return_value.mode = mode
+
+    assert _get_vcs_qualifiers(rooted_tmp_path) == {
+        "vcs_url": "git+https://github.com/org/repo@abc"
+    }
+    mock_get_vcs_qualifiers.assert_called_once_with(rooted_tmp_path.root)
+
+
+@mock.patch("hermeto.core.package_managers.bundler.main.get_config")
+@mock.patch("hermeto.core.package_managers.bundler.main.get_vcs_qualifiers")
+def test_get_vcs_qualifiers_without_git_repo(
+    mock_get_vcs_qualifiers: mock.Mock,
+    mock_get_config: mock.Mock,
+    rooted_tmp_path: RootedPath,
+) -> None:
+    mock_get_vcs_qualifiers.side_effect = NotAGitRepo("Not a git repo", solution="N/A")
+
+    mock_get_config.return_value.mode = Mode.PERMISSIVE
+    assert _get_vcs_qualifiers(rooted_tmp_path) is None
+
+    mock_get_config.return_value.mode = Mode.STRICT
+    with pytest.raises(NotAGitRepo):
+        _get_vcs_qualifiers(rooted_tmp_path)
@@ -313,3 +313,16 @@ def test_merging_spdx_sboms_produces_consistent_relationships_ordering(
     assert _same_relationship_order(merged_sbom2, merged_sbom3), "Order mismatch!"
 
     _assert_sbom_is_well_formed(merged_sbom1)
+
+
+def test_merging_spdx_sboms_does_not_modify_operands() -> None:
+    sbom_main = SPDXSbom.from_file(
+        Path("./tests/unit/data/sboms/something.simple0.100.0.spdx.pretty.json")
+    )
+    sbom_other = SPDXSbom.from_file(Path("./tests/unit/data/sboms/alpine.pretty.json"))
+    main_before, other_before = sbom_main.model_dump(), sbom_other.model_dump()
+
+    sbom_main + sbom_other
+
+    assert sbom_main.model_dump() == main_before
+    assert sbom_other.model_dump() == other_before